@@ -0,0 +1,19 @@
+"""
+Gunicorn Production Configuration
+
+This service is I/O-bound: most request time is spent waiting on outbound
+PokeAPI calls. gevent workers let those waits overlap across many
+concurrent requests instead of serializing on the single-threaded dev
+server (the gevent worker monkey-patches the stdlib on startup, so
+`requests` cooperates automatically).
+
+Run with:
+    gunicorn -c gunicorn.conf.py run:app
+"""
+
+import os
+
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+workers = (os.cpu_count() or 1) * 2 + 1
+worker_connections = 1000
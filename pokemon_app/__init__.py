@@ -1,13 +1,30 @@
+import orjson
 from flask import Flask
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from pokemon_app.config import Config
 
 db = SQLAlchemy()
 
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, so every jsonify call serializes in C."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app(config_class=Config):
     """Application factory pattern."""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = ORJSONProvider(app)
+    Compress(app)
 
     db.init_app(app)
 
@@ -15,6 +32,19 @@ def create_app(config_class=Config):
     app.register_blueprint(api_bp, url_prefix='/api/v1')
 
     with app.app_context():
+        engine = db.engine
+        if engine.dialect.name == 'sqlite':
+            # WAL lets writers proceed without blocking readers and batches
+            # fsyncs; synchronous=NORMAL drops the second fsync per commit.
+            @event.listens_for(engine, 'connect')
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA cache_size=-64000")
+                cursor.close()
+
         db.create_all()
 
     return app 
\ No newline at end of file
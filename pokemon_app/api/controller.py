@@ -7,38 +7,64 @@ and formats the responses (including proper HTTP status codes).
 """
 
 from typing import Tuple
-from flask import jsonify, Response
+
+import orjson
+from flask import g, jsonify, Response, stream_with_context
+
 from pokemon_app.api import bp
 from pokemon_app.service.pokemon_svc import PokemonService
-from pokemon_app.service.pokeapi import PokeAPIClient
+from pokemon_app.service.pokeapi import get_client
 from pokemon_app.repository.pokemon_repo import PokemonRepository
 from pokemon_app.config import POKEMON_LIST
 
 
 def get_service() -> PokemonService:
     """
-    Instantiates and returns the PokemonService with its dependencies.
+    Returns the PokemonService for the current request context.
+
+    The service and its dependencies are stateless, so one instance per
+    request is enough; caching it on flask.g avoids rebuilding the whole
+    dependency graph (repository, API client) on every handler call.
 
     Returns:
         PokemonService: A configured service instance.
     """
-    # Explicit dependency injection for clarity
-    return PokemonService(
-        repository=PokemonRepository(),
-        api_client=PokeAPIClient()
-    )
+    if 'pokemon_service' not in g:
+        # Explicit dependency injection for clarity
+        g.pokemon_service = PokemonService(
+            repository=PokemonRepository(),
+            api_client=get_client()
+        )
+    return g.pokemon_service
 
 
 @bp.route('/pokemon', methods=['GET'])
 def get_all_pokemon() -> Response:
     """
-    Retrieves a list of all Pokémon stored in the database.
+    Retrieves a summary list of all Pokémon stored in the database.
+
+    The bulky moves/abilities/stats fields are omitted here; fetch a
+    single Pokémon to get the full payload.
 
     Returns:
-        Response: JSON list of Pokémon data.
+        Response: JSON list of Pokémon summary data.
     """
     service = get_service()
-    return jsonify(service.get_all_pokemon())
+
+    def generate():
+        # Stream one orjson-encoded row at a time over the chunked cursor,
+        # keeping memory constant regardless of table size.
+        yield b'['
+        first = True
+        for row in service.iter_all_pokemon():
+            if first:
+                first = False
+            else:
+                yield b','
+            yield orjson.dumps(row, option=orjson.OPT_NAIVE_UTC)
+        yield b']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @bp.route('/pokemon/<name>', methods=['GET'])
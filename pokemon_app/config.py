@@ -5,6 +5,7 @@ This module defines the configuration settings for the Flask application,
 including database connections, external API endpoints, and business data constants.
 """
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -18,6 +19,14 @@ DATABASE_URL = f"sqlite:///{BASE_DIR}/pokemon.db"
 # External PokeAPI Base URL
 POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
 
+# Upstream Pokemon data is near-static, so cached responses stay valid
+# for a long time. TTL is expressed in seconds (default: 24 hours).
+POKEAPI_CACHE_TTL = 86400
+
+# Optional Redis backend for the PokeAPI response cache.
+# When unset (the default), an in-process TTL cache is used instead.
+REDIS_URL = os.environ.get("REDIS_URL")
+
 # Initial list of Pokemon to scout (as requested in the Project Brief).
 # Note: The Service layer handles typo correction form the docs (e.g., 'terodactyl' -> 'aerodactyl').
 POKEMON_LIST: List[str] = [
@@ -6,7 +6,6 @@ It maps the application's data structure to the underlying 'pokemon' database ta
 and handles serialization for API responses.
 """
 
-from datetime import datetime
 from typing import Dict, Any
 from pokemon_app import db
 
@@ -45,9 +44,17 @@ class Pokemon(db.Model):
     types = db.Column(db.JSON)
     moves = db.Column(db.JSON)
 
-    # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.now)
-    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    # Timestamps, computed by the database rather than in Python per row.
+    # onupdate uses the SQL now() expression so UPDATE statements refresh
+    # updated_at inline without a Python-side call.
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    # Functional index so case-insensitive lookups stay index-backed on
+    # backends like Postgres (SQLite resolves them via the unique column).
+    __table_args__ = (
+        db.Index('ix_pokemon_name_lower', db.func.lower(name), unique=True),
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -6,7 +6,10 @@ It abstracts the underlying database interactions (SQLAlchemy sessions, queries)
 providing a clean, object-oriented interface for the Service layer to use.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set
+
+from sqlalchemy import insert, select, update
+
 from pokemon_app import db
 from pokemon_app.model.pokemon import Pokemon
 
@@ -16,17 +19,35 @@ class PokemonRepository:
     Handles all database persistence operations for Pokemon entities.
     """
 
+    # Insert construct built once and reused; executing it with a list of
+    # row dicts lets SQLAlchemy batch them via insertmanyvalues instead of
+    # compiling and binding an INSERT per row.
+    _INSERT = insert(Pokemon)
+
+    # Listing projection: the moves list alone can hold 200+ strings per
+    # Pokemon and dominates list-endpoint payloads, so the bulky JSON
+    # columns are excluded from the summary select.
+    _SUMMARY_SELECT = select(
+        *[
+            column for column in Pokemon.__table__.c
+            if column.name not in ('moves', 'abilities', 'stats')
+        ]
+    )
+
     def get_by_name(self, name: str) -> Optional[Pokemon]:
         """
-        Retrieves a Pokemon entity by its name (case-insensitive).
+        Retrieves a Pokemon entity by its name.
+
+        Names are stored pre-lowercased and callers pass normalized names,
+        so no per-query case folding is needed here.
 
         Args:
-            name (str): The name of the Pokemon to retrieve.
+            name (str): The normalized (lowercase) name of the Pokemon.
 
         Returns:
             Optional[Pokemon]: The Pokemon instance if found, otherwise None.
         """
-        return Pokemon.query.filter_by(name=name.lower()).first()
+        return Pokemon.query.filter_by(name=name).first()
 
     def get_all(self) -> List[Pokemon]:
         """
@@ -52,6 +73,99 @@ class PokemonRepository:
         db.session.commit()
         return pokemon
 
+    def get_all_rows(self) -> List[Dict[str, Any]]:
+        """
+        Retrieves all Pokemon as plain column dictionaries.
+
+        Uses a Core select against the underlying table, skipping ORM object
+        construction entirely — the rows go straight to the serializer.
+
+        Returns:
+            List[Dict[str, Any]]: One dictionary per stored Pokemon row.
+        """
+        result = db.session.execute(select(Pokemon.__table__))
+        return [dict(row) for row in result.mappings()]
+
+    def iter_summaries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams summary rows (no moves/abilities/stats) for all Pokemon.
+
+        Rows are fetched through the cursor in chunks of 500, so memory
+        usage stays constant no matter how large the table grows.
+
+        Yields:
+            Dict[str, Any]: One summary dictionary per stored Pokemon row.
+        """
+        result = db.session.execute(
+            self._SUMMARY_SELECT.execution_options(yield_per=500)
+        )
+        for row in result.mappings():
+            yield dict(row)
+
+    def existing_names(self, names: Iterable[str]) -> Set[str]:
+        """
+        Checks which of the given names are already stored, in one query.
+
+        Args:
+            names (Iterable[str]): Normalized Pokemon names to look up.
+
+        Returns:
+            Set[str]: The subset of names present in the database.
+        """
+        names = list(names)
+        if not names:
+            return set()
+        return {
+            name for (name,) in
+            db.session.query(Pokemon.name).filter(Pokemon.name.in_(names)).all()
+        }
+
+    def update_by_name(self, name: str, values: Dict[str, Any]) -> int:
+        """
+        Updates a Pokemon row with one UPDATE statement, no object load.
+
+        Args:
+            name (str): The normalized name identifying the row.
+            values (Dict[str, Any]): Column values to write.
+
+        Returns:
+            int: Number of rows matched (0 when the Pokemon is not stored).
+        """
+        result = db.session.execute(
+            update(Pokemon)
+            .where(Pokemon.name == name)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount
+
+    def bulk_upsert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Inserts a batch of Pokemon rows in a single transaction.
+
+        Rows whose names already exist are filtered out with one IN-query,
+        so the whole batch costs two statements (SELECT + multi-row INSERT)
+        instead of a SELECT, INSERT and COMMIT per row.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column dictionaries matching the
+                Pokemon model, as produced by the PokeAPI client.
+
+        Returns:
+            List[Dict[str, Any]]: The subset of rows that were actually inserted.
+        """
+        if not rows:
+            return []
+
+        existing = self.existing_names(row['name'] for row in rows)
+        new_rows = [row for row in rows if row['name'] not in existing]
+
+        if new_rows:
+            db.session.execute(self._INSERT, new_rows)
+            db.session.commit()
+        return new_rows
+
     def delete(self, pokemon: Pokemon) -> None:
         """
         Removes a Pokemon entity from the database.
@@ -6,13 +6,101 @@ It handles HTTP communication, error handling, and data normalization
 to convert external API responses into the application's internal data structure.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import functools
+import json
+import time
+from operator import itemgetter
+from typing import Dict, Any, Optional, Tuple
+
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
-from pokemon_app.config import POKEAPI_BASE_URL
+# Redis is an optional cache backend; the client falls back to an
+# in-process TTL cache when the package (or server) is unavailable.
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from pokemon_app.config import POKEAPI_BASE_URL, POKEAPI_CACHE_TTL, REDIS_URL
 from pokemon_app.logger.logger import logger
 
+# Shared session with keep-alive connection pooling.
+# Reusing sockets across calls avoids paying the TCP + TLS handshake
+# (~100-300 ms against pokeapi.co) on every request, and the retry policy
+# transparently absorbs transient upstream errors.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+# Response cache: Redis when configured, in-process TTL dict otherwise.
+# Upstream Pokemon data is near-static, so a long TTL turns repeated
+# lookups into microsecond-level hits instead of full HTTP round-trips.
+_redis_client: Optional["redis.Redis"] = None
+_local_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Pre-bound extractors for response flattening. itemgetter runs in C, so
+# mapping it over the (often 200+ item) moves list beats a comprehension
+# doing chained dict lookups in Python bytecode.
+_NAME = itemgetter('name')
+_ABILITY = itemgetter('ability')
+_TYPE = itemgetter('type')
+_MOVE = itemgetter('move')
+
+
+def _get_redis() -> Optional["redis.Redis"]:
+    """Lazily connects to Redis when a REDIS_URL is configured."""
+    global _redis_client
+    if _redis_client is None and redis is not None and REDIS_URL:
+        try:
+            _redis_client = redis.Redis.from_url(REDIS_URL)
+            _redis_client.ping()
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache unavailable, using in-process cache: {e}")
+            _redis_client = None
+    return _redis_client
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Returns a cached processed response, or None on miss/expiry."""
+    client = _get_redis()
+    if client is not None:
+        try:
+            cached = client.get(key)
+            if cached:
+                return json.loads(cached)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache read failed: {e}")
+
+    entry = _local_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _cache_set(key: str, value: Dict[str, Any]) -> None:
+    """Stores a processed response under the configured TTL."""
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.setex(key, POKEAPI_CACHE_TTL, json.dumps(value))
+            return
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+    _local_cache[key] = (time.monotonic() + POKEAPI_CACHE_TTL, value)
+
 
 class PokeAPIClient:
     """
@@ -28,6 +116,10 @@ class PokeAPIClient:
         """Initialize the client with configuration values."""
         self.base_url = POKEAPI_BASE_URL
         self._timeout = 10  # Timeout in seconds to prevent hanging
+        # All instances share the module-level pooled session, so sockets
+        # (and their TLS handshakes) are reused no matter how many clients
+        # the app constructs.
+        self.session = _SESSION
 
     def get_pokemon(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -43,16 +135,63 @@ class PokeAPIClient:
         # API requires lowercase names
         target_url = f"{self.base_url}/pokemon/{name.lower()}"
 
+        # Serve from cache first; upstream data is near-static
+        cache_key = f"pokeapi:v1:{name.lower()}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(target_url, timeout=self._timeout)
+            response = self.session.get(target_url, timeout=self._timeout)
             response.raise_for_status()
-            
-            return self._process_pokemon_data(data=response.json())
+
+            processed = self._process_pokemon_data(data=response.json())
+            _cache_set(cache_key, processed)
+            return processed
 
         except RequestException as e:
             logger.error(f"Failed to fetch Pokemon '{name}' from API: {e}")
             return None
 
+    async def get_pokemon_async(
+        self, session: aiohttp.ClientSession, name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronous variant of get_pokemon for concurrent batch fetching.
+
+        The caller owns the aiohttp session so that a single connection pool
+        is shared across all concurrent requests (e.g. during the startup sync).
+
+        Args:
+            session (aiohttp.ClientSession): The shared HTTP session to use.
+            name (str): The name of the Pokemon to fetch.
+
+        Returns:
+            Optional[Dict[str, Any]]: A dictionary of sanitized Pokemon data
+            matching the internal model structure, or None if the request fails.
+        """
+        # API requires lowercase names
+        target_url = f"{self.base_url}/pokemon/{name.lower()}"
+
+        # Serve from cache first; upstream data is near-static
+        cache_key = f"pokeapi:v1:{name.lower()}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with session.get(
+                target_url, timeout=aiohttp.ClientTimeout(total=self._timeout)
+            ) as response:
+                response.raise_for_status()
+                processed = self._process_pokemon_data(data=await response.json())
+                _cache_set(cache_key, processed)
+                return processed
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to fetch Pokemon '{name}' from API: {e}")
+            return None
+
     def _process_pokemon_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sanitizes and formats the raw API response.
@@ -66,19 +205,32 @@ class PokeAPIClient:
         Returns:
             Dict[str, Any]: The processed data ready for model instantiation.
         """
+        # The PokeAPI contract guarantees these keys, so the lists are
+        # indexed directly and flattened with the C-level extractors above.
         return {
-            'name': data['name'],
+            # Stored pre-lowercased so lookups never need case folding
+            'name': data['name'].lower(),
             # API returns height in decimeters, convert to meters
             'height': data['height'] / 10,
             # API returns weight in hectograms, convert to kilograms
             'weight': data['weight'] / 10,
             'base_experience': data['base_experience'],
-            # Use .get() for lists to ensure empty list if key is missing
-            'abilities': [item['ability']['name'] for item in data.get('abilities', [])],
+            'abilities': list(map(_NAME, map(_ABILITY, data['abilities']))),
             'stats': {
-                item['stat']['name']: item['base_stat'] 
-                for item in data.get('stats', [])
+                item['stat']['name']: item['base_stat']
+                for item in data['stats']
             },
-            'types': [item['type']['name'] for item in data.get('types', [])],
-            'moves': [item['move']['name'] for item in data.get('moves', [])]
+            'types': list(map(_NAME, map(_TYPE, data['types']))),
+            'moves': list(map(_NAME, map(_MOVE, data['moves'])))
         }
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> PokeAPIClient:
+    """
+    Returns the process-wide PokeAPIClient instance.
+
+    The client is stateless beyond its shared session, so callers reuse a
+    single cached instance instead of constructing one per request.
+    """
+    return PokeAPIClient()
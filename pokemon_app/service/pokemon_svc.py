@@ -11,18 +11,39 @@ Key Responsibilities:
 - Coordination of data fetching and persistence.
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+import asyncio
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+import aiohttp
+
 from pokemon_app.model.pokemon import Pokemon
 from pokemon_app.service.pokeapi import PokeAPIClient
 from pokemon_app.repository.pokemon_repo import PokemonRepository
 from pokemon_app.logger.logger import logger
 
 
+# Business Logic: known input typos mapped to real API names, built once
+# and shared read-only across all service instances.
+# Example: "Terodactyl" (Brief) -> "Aerodactyl" (Actual API Name)
+_NAME_MAP = types.MappingProxyType({
+    "terodactyl": "aerodactyl"
+})
+
+
 class PokemonService:
     """
     Service class handling the business logic for Pokemon data operations.
     """
 
+    # Columns a refresh may touch: 'name' is the lookup key, and id plus
+    # the timestamps are managed by the database.
+    _UPDATABLE = frozenset({
+        'height', 'weight', 'base_experience',
+        'abilities', 'stats', 'types', 'moves'
+    })
+
     def __init__(self, repository: PokemonRepository, api_client: PokeAPIClient) -> None:
         """
         Initialize the service with necessary dependencies.
@@ -33,33 +54,52 @@ class PokemonService:
         """
         self.repository = repository
         self.api_client = api_client
-        # Business Logic: Mappings to correct known typos in input data
-        # Example: "Terodactyl" (Brief) -> "Aerodactyl" (Actual API Name)
-        self._name_mapping = {
-            "terodactyl": "aerodactyl"
-        }
 
-    def _normalize_name(self, name: str) -> str:
+    @staticmethod
+    def _normalize_name(name: str) -> str:
         """
         Sanitizes and corrects Pokemon names based on business rules.
 
+        Already-lowercase input (the common case) skips the lower() pass
+        entirely; the typo map is a shared module-level constant.
+
         Args:
             name (str): The raw input name.
 
         Returns:
             str: The sanitized and mapped name (lowercase).
         """
-        clean_name = name.lower().strip()
-        return self._name_mapping.get(clean_name, clean_name)
+        clean_name = name.strip()
+        if not clean_name.islower():
+            clean_name = clean_name.lower()
+        return _NAME_MAP.get(clean_name, clean_name)
 
     def get_all_pokemon(self) -> List[Dict[str, Any]]:
         """
         Retrieve all Pokemon stored in the local database.
 
+        Rows come straight from a Core select as plain dictionaries
+        (timestamps remain datetime objects for the serializer to handle),
+        avoiding per-row ORM materialization and to_dict calls.
+
         Returns:
-            List[Dict[str, Any]]: A list of serialized Pokemon data dictionaries.
+            List[Dict[str, Any]]: A list of Pokemon data dictionaries.
+        """
+        return self.repository.get_all_rows()
+
+    def iter_all_pokemon(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream summaries of all Pokemon in the local database, row by row.
+
+        The bulky moves/abilities/stats fields are omitted from the listing;
+        the single-record endpoint serves the full payload. Backed by a
+        chunked cursor in the repository, so callers (e.g. a streaming HTTP
+        response) never hold the full result set in memory.
+
+        Yields:
+            Dict[str, Any]: One Pokemon summary dictionary per stored row.
         """
-        return [p.to_dict() for p in self.repository.get_all()]
+        return self.repository.iter_summaries()
 
     def get_pokemon(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -136,21 +176,18 @@ class PokemonService:
             Tuple[bool, str]: A tuple containing the success status and a message.
         """
         normalized_name = self._normalize_name(name)
-        pokemon = self.repository.get_by_name(normalized_name)
-
-        if not pokemon:
-            return False, f"Pokemon {normalized_name} not found locally"
 
         raw_data = self.api_client.get_pokemon(normalized_name)
         if not raw_data:
             return False, f"Failed to fetch update for {normalized_name}"
 
-        # Update fields dynamically
-        for key, value in raw_data.items():
-            if hasattr(pokemon, key):
-                setattr(pokemon, key, value)
+        # Whitelist the updatable columns via set intersection, then issue
+        # one UPDATE round-trip; rowcount tells us whether the record existed
+        values = {key: raw_data[key] for key in self._UPDATABLE.intersection(raw_data)}
+        updated = self.repository.update_by_name(normalized_name, values)
+        if not updated:
+            return False, f"Pokemon {normalized_name} not found locally"
 
-        self.repository.save(pokemon)
         return True, f"Successfully updated {normalized_name}"
 
     def sync_config_list(self, pokemon_list: List[str]) -> None:
@@ -161,12 +198,85 @@ class PokemonService:
             pokemon_list (List[str]): List of Pokemon names to sync.
         """
         logger.info("Starting batch sync...")
-        for name in pokemon_list:
-            data, msg = self.add_pokemon(name)
-            if data and "already exists" not in msg:
-                logger.info(msg)
-            elif "already exists" in msg:
-                logger.info(f"Skipping {name}: {msg}")
+        # Normalize and dedupe up front (dict.fromkeys keeps input order)
+        names = list(dict.fromkeys(self._normalize_name(n) for n in pokemon_list))
+
+        # One IN-query up front instead of an existence SELECT per name;
+        # names already present never hit the external API at all.
+        existing = self.repository.existing_names(names)
+        for name in existing:
+            logger.info(f"Skipping {name}: already exists in database")
+
+        # The remaining fetches are independent, so fan them out across a
+        # small thread pool; total wait approaches the slowest request
+        # instead of the sum of all of them.
+        missing = [name for name in names if name not in existing]
+        results = []
+        if missing:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self.api_client.get_pokemon, missing))
+
+        rows = []
+        for name, raw_data in zip(missing, results):
+            if raw_data:
+                rows.append(raw_data)
             else:
-                logger.error(msg)
+                logger.error(f"Failed to fetch data for {name}")
+
+        self._persist_batch(rows)
         logger.info("Batch sync finished.")
+
+    def _persist_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Persists a batch of fetched rows in one transaction.
+
+        Args:
+            rows (List[Dict[str, Any]]): Processed data dictionaries to insert.
+        """
+        inserted = self.repository.bulk_upsert(rows)
+        inserted_names = {row['name'] for row in inserted}
+        for row in rows:
+            if row['name'] in inserted_names:
+                logger.info(f"Successfully added {row['name']} to database")
+            else:
+                logger.info(f"Skipping {row['name']}: already exists in database")
+
+    async def sync_config_list_async(self, pokemon_list: List[str]) -> None:
+        """
+        Concurrent variant of sync_config_list for the startup path.
+
+        All external API requests are issued at once over a single shared
+        aiohttp session, so total wall time approaches the slowest request
+        instead of the sum of all of them. Persistence happens afterwards
+        in one sequential pass.
+
+        Args:
+            pokemon_list (List[str]): List of Pokemon names to sync.
+        """
+        logger.info("Starting concurrent batch sync...")
+        # Normalize and dedupe up front (dict.fromkeys keeps input order)
+        names = list(dict.fromkeys(self._normalize_name(n) for n in pokemon_list))
+
+        # One IN-query up front instead of an existence SELECT per name;
+        # names already present never hit the external API at all.
+        existing = self.repository.existing_names(names)
+        for name in existing:
+            logger.info(f"Skipping {name}: already exists in database")
+        missing = [name for name in names if name not in existing]
+
+        # Fan out all fetches under one shared session (one connection pool)
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *[self.api_client.get_pokemon_async(session, name) for name in missing]
+            )
+
+        # Single transactional persistence pass over the fetched results
+        rows = []
+        for name, raw_data in zip(missing, results):
+            if raw_data:
+                rows.append(raw_data)
+            else:
+                logger.error(f"Failed to fetch data for {name}")
+
+        self._persist_batch(rows)
+        logger.info("Concurrent batch sync finished.")
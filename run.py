@@ -6,11 +6,15 @@ It handles the application factory creation, performs an initial data synchroniz
 on startup, and launches the development server.
 """
 
+import asyncio
+import os
+import threading
+
 from pokemon_app import create_app
 from pokemon_app.config import POKEMON_LIST
 from pokemon_app.service.pokemon_svc import PokemonService
 from pokemon_app.repository.pokemon_repo import PokemonRepository
-from pokemon_app.service.pokeapi import PokeAPIClient
+from pokemon_app.service.pokeapi import get_client
 
 # Initialize the Flask application using the factory pattern
 app = create_app()
@@ -26,16 +30,26 @@ def initial_sync() -> None:
     """
     # Manual dependency injection for the startup script
     repository = PokemonRepository()
-    api_client = PokeAPIClient()
-    service = PokemonService(repository=repository, api_client=api_client)
+    service = PokemonService(repository=repository, api_client=get_client())
 
-    service.sync_config_list(pokemon_list=POKEMON_LIST)
+    # Fetch all configured Pokemon concurrently instead of one-by-one
+    asyncio.run(service.sync_config_list_async(pokemon_list=POKEMON_LIST))
 
 
-if __name__ == '__main__':
-    # Ensure database tables exist and initial data is populated
+def _background_sync() -> None:
+    """Runs the initial sync inside an application context on a worker thread."""
     with app.app_context():
         initial_sync()
 
-    # Launch the Flask development server
+
+if __name__ == '__main__':
+    # Warm the database in the background so the server accepts traffic
+    # immediately instead of blocking on N external API calls at startup.
+    # Set SYNC_ON_STARTUP=0 to skip the sync entirely.
+    if os.environ.get('SYNC_ON_STARTUP', '1') != '0':
+        threading.Thread(target=_background_sync, daemon=True).start()
+
+    # Launch the Flask development server (local use only).
+    # In production, run behind gunicorn instead:
+    #   gunicorn -c gunicorn.conf.py run:app
     app.run(debug=True)
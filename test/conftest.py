@@ -2,61 +2,164 @@
 Pytest Configuration Module
 
 This module defines fixtures for the test suite, including:
-1. A Flask application instance configured for testing (In-Memory SQLite).
-2. A test client for making HTTP requests.
-3. A mock for the external PokeAPIClient to prevent real network calls.
+1. A session-scoped Flask application instance (In-Memory SQLite).
+2. A function-scoped transactional DB session for test isolation.
+3. A test client for making HTTP requests.
+4. A mock for the external PokeAPIClient to prevent real network calls.
+
+The app and schema are built once per session; each test then runs inside
+a connection-level transaction that is rolled back on teardown, which is
+far cheaper than rebuilding the app and dropping/recreating tables per test.
 """
 
+import types
+
 import pytest
-from unittest.mock import MagicMock
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+# Guard against stray editor/backup copies of test modules being collected
+# and silently doubling the suite's wall-clock.
+collect_ignore_glob = ["*_copy*.py", "*.orig", "*.bak"]
+from sqlalchemy.pool import StaticPool
 from pokemon_app import create_app, db
 from pokemon_app.config import Config
+from pokemon_app.repository.pokemon_repo import PokemonRepository
+from pokemon_app.service.pokeapi import get_client
 
 class TestConfig(Config):
     """Test configuration using in-memory SQLite."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # StaticPool shares one connection process-wide so every session sees
+    # the same in-memory database (a fresh connection would get an empty one)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False},
+    }
     # Disable CSRF protection in tests if enabled later
     WTF_CSRF_ENABLED = False
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def app():
     """
-    Creates a fresh Flask application instance for each test.
+    Creates the Flask application once for the whole test session.
     """
     app = create_app(TestConfig)
-    
+
     with app.app_context():
-        # Create all tables in the in-memory database
+        # pysqlite emits its own BEGIN at non-deterministic times, which
+        # breaks SAVEPOINT-based rollback; take over transaction control
+        # explicitly (the workaround documented by SQLAlchemy for sqlite).
+        @event.listens_for(db.engine, 'connect')
+        def _disable_pysqlite_begin(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(db.engine, 'begin')
+        def _emit_begin(conn):
+            conn.exec_driver_sql('BEGIN')
+
+        # Create all tables once; per-test isolation is transactional
         db.create_all()
         yield app
-        # Teardown: Drop all tables after test
+        # Teardown: Drop all tables after the session
         db.session.remove()
         db.drop_all()
 
 @pytest.fixture
-def client(app):
+def db_session(app):
+    """
+    Wraps each test in a connection-level transaction rolled back on teardown.
+
+    The application's session is temporarily rebound to a dedicated
+    connection with an open outer transaction; commits inside the app are
+    absorbed into savepoints, and the final rollback discards everything,
+    so the schema never needs rebuilding between tests.
+    """
+    # A preceding read-only test may have left the shared Flask-SQLAlchemy
+    # session holding an implicit transaction on the single pooled
+    # connection; clear it before claiming the connection for this test.
+    db.session.remove()
+
+    connection = db.engine.connect()
+    transaction = connection.begin()
+
+    original_session = db.session
+    # create_savepoint makes the SAVEPOINT behavior explicit: every commit
+    # issued by application code releases a savepoint (and a new one is
+    # opened for the next unit of work), while the outer transaction above
+    # stays open until the teardown rollback discards everything.
+    db.session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode='create_savepoint')
+    )
+
+    yield db.session
+
+    db.session.remove()
+    db.session = original_session
+    transaction.rollback()
+    connection.close()
+
+@pytest.fixture
+def client(app, db_session):
     """
     Provides a test client for making requests to the application.
     """
     return app.test_client()
 
 @pytest.fixture
-def mock_pokeapi(mocker):
+def pokemon_repo(db_session):
     """
-    Mocks the PokeAPIClient to avoid real network requests.
-    This patch ensures that any instance of PokeAPIClient used in the app
-    will use our mock methods.
+    Repository bound to the transactional test session, for seeding DB
+    state directly without going through the HTTP stack.
+    """
+    return PokemonRepository()
+
+@pytest.fixture(scope='module')
+def readonly_client(app):
+    """
+    Module-scoped test client for tests that never write DB state.
+
+    Reuses one Werkzeug Client object (and skips the per-test
+    transactional session setup); write-path tests must keep using the
+    function-scoped client fixture.
+    """
+    with app.test_client() as test_client:
+        yield test_client
+
+@pytest.fixture(scope='module')
+def _pokeapi_patcher(module_mocker):
+    """
+    Installs the PokeAPIClient.get_pokemon patch once per module.
+
+    Since we instantiate the client in the controller/service, we patch the
+    class itself; module scope means the patch machinery (sys.modules walk,
+    MagicMock construction, install/remove) runs once instead of per test.
     """
-    # Patch the class where it is IMPORTED in the controller/service
-    # Since we instantiate it in the controller/service, we patch the class itself
-    mock_get = mocker.patch('pokemon_app.service.pokeapi.PokeAPIClient.get_pokemon')
-    return mock_get
+    return module_mocker.patch('pokemon_app.service.pokeapi.PokeAPIClient.get_pokemon')
 
 @pytest.fixture
+def mock_pokeapi(_pokeapi_patcher):
+    """
+    Mocks the PokeAPIClient to avoid real network requests.
+    Hands out the module-scoped patch and clears any configured return
+    value/side effect on teardown so state never leaks between tests.
+    """
+    yield _pokeapi_patcher
+    _pokeapi_patcher.reset_mock(return_value=True, side_effect=True)
+    # Drop the cached singleton client so no instance built under an
+    # active patch bleeds into later tests.
+    get_client.cache_clear()
+
+@pytest.fixture(scope='session')
 def sample_pokemon_data():
-    """Returns a standardized Pokemon data dictionary for mocking."""
-    return {
+    """
+    Returns a standardized, read-only Pokemon data mapping for mocking.
+
+    Frozen as a MappingProxyType so no test can mutate shared state;
+    tests needing variations build a new dict, e.g. dict(data, weight=1.0).
+    """
+    return types.MappingProxyType({
         'name': 'pikachu',
         'height': 0.4,
         'weight': 6.0,
@@ -65,4 +168,4 @@ def sample_pokemon_data():
         'stats': {'speed': 90},
         'types': ['electric'],
         'moves': ['thunder-shock']
-    }
+    })
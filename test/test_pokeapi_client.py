@@ -2,15 +2,49 @@
 Unit Tests for PokeAPIClient
 
 Tests edge cases like network errors, timeouts, and 404s from the external provider.
+The HTTP transport is patched once for the whole module and reset between tests,
+a single client instance is shared, and the three fetch-outcome scenarios run
+as one parametrized test instead of three separate functions.
 """
+from unittest.mock import Mock
+
 import pytest
 import requests
 from pokemon_app.service.pokeapi import PokeAPIClient
 
-def test_client_fetch_success(mocker):
-    """Test successful data fetching and normalization."""
-    # Mock the requests.get call specifically
-    mock_response = mocker.Mock()
+
+@pytest.fixture(scope="module")
+def poke_client():
+    """One client instance shared by every test in this module."""
+    return PokeAPIClient()
+
+
+@pytest.fixture(scope="module")
+def mocked_session_get(module_mocker):
+    """Patches the pooled session's get once for the whole module."""
+    return module_mocker.patch('requests.Session.get')
+
+
+@pytest.fixture(autouse=True)
+def _reset_transport(mocked_session_get):
+    """Clears return values/side effects off the shared mock before each test."""
+    mocked_session_get.reset_mock(return_value=True, side_effect=True)
+
+
+def test_client_shares_pooled_session():
+    """Every client instance must reuse the module-level pooled session."""
+    first = PokeAPIClient()
+    second = PokeAPIClient()
+    assert first.session is second.session
+
+    adapter = first.session.get_adapter('https://pokeapi.co')
+    assert adapter._pool_connections == 20
+    assert adapter._pool_maxsize == 50
+
+
+def _success_setup(mock_get):
+    """Successful fetch returning raw bulbasaur data."""
+    mock_response = Mock()
     mock_response.json.return_value = {
         'name': 'bulbasaur',
         'height': 7,    # 7 decimeters
@@ -22,37 +56,42 @@ def test_client_fetch_success(mocker):
         'moves': []
     }
     mock_response.raise_for_status.return_value = None
-    
-    mocker.patch('requests.get', return_value=mock_response)
+    mock_get.return_value = mock_response
 
-    client = PokeAPIClient()
-    result = client.get_pokemon('bulbasaur')
 
-    # Verify conversions (Decimeters -> Meters, Hectograms -> KG)
-    assert result['name'] == 'bulbasaur'
-    assert result['height'] == 0.7  # 7 / 10
-    assert result['weight'] == 6.9  # 69 / 10
+def _http_error_setup(mock_get):
+    """Simulates a 404 HTTPError from the provider."""
+    mock_response = Mock()
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "404 Client Error"
+    )
+    mock_get.return_value = mock_response
 
-def test_client_404_not_found(mocker):
-    """Test API returning 404."""
-    mock_response = mocker.Mock()
-    # Simulate a 404 HTTPError
-    error = requests.exceptions.HTTPError("404 Client Error")
-    mock_response.raise_for_status.side_effect = error
-    
-    mocker.patch('requests.get', return_value=mock_response)
 
-    client = PokeAPIClient()
-    result = client.get_pokemon('missingno')
+def _timeout_setup(mock_get):
+    """Simulates a network timeout."""
+    mock_get.side_effect = requests.exceptions.Timeout
 
-    assert result is None
 
-def test_client_timeout(mocker):
-    """Test API timeout."""
-    # Simulate a Timeout exception
-    mocker.patch('requests.get', side_effect=requests.exceptions.Timeout)
+@pytest.mark.parametrize(
+    "name,setup,expected",
+    [
+        # Verify conversions (Decimeters -> Meters, Hectograms -> KG)
+        ('bulbasaur', _success_setup,
+         {'name': 'bulbasaur', 'height': 0.7, 'weight': 6.9}),
+        ('missingno', _http_error_setup, None),
+        ('snorlax', _timeout_setup, None),
+    ],
+    ids=['fetch-success', '404-not-found', 'timeout'],
+)
+def test_client_fetch_outcomes(mocked_session_get, poke_client, name, setup, expected):
+    """Exercises success, provider-error and timeout paths in one test."""
+    setup(mocked_session_get)
 
-    client = PokeAPIClient()
-    result = client.get_pokemon('snorlax')
+    result = poke_client.get_pokemon(name)
 
-    assert result is None
+    if expected is None:
+        assert result is None
+    else:
+        for key, value in expected.items():
+            assert result[key] == value